@@ -16,6 +16,13 @@ class Settings:
     SESSION_TIMEOUT: int = int(os.getenv("SESSION_TIMEOUT", "300"))  # 5 minutes
     PIN_ATTEMPTS_LIMIT: int = int(os.getenv("PIN_ATTEMPTS_LIMIT", "3"))
     
+    # Dialog Event Log
+    EVENT_LOG_ENABLED: bool = os.getenv("EVENT_LOG_ENABLED", "True").lower() == "true"
+    EVENT_LOG_DIR: str = os.getenv("EVENT_LOG_DIR", "logs/events")
+    EVENT_LOG_SEGMENT_BYTES: int = int(os.getenv("EVENT_LOG_SEGMENT_BYTES", str(16 * 1024 * 1024)))
+    EVENT_LOG_SEGMENT_SECONDS: int = int(os.getenv("EVENT_LOG_SEGMENT_SECONDS", "300"))  # 5 minutes
+    EVENT_LOG_QUEUE_SIZE: int = int(os.getenv("EVENT_LOG_QUEUE_SIZE", "10000"))
+    
     # Security
     API_KEY: Optional[str] = os.getenv("API_KEY")
     
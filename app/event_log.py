@@ -0,0 +1,181 @@
+import glob
+import json
+import os
+import queue
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".ndjson"
+OPEN_SEGMENT_SUFFIX = ".ndjson.part"
+
+class DialogEventLog:
+    """
+    Append-only log of USSD dialog hops.
+
+    Events are queued by the request path and written by a background
+    thread as newline-delimited JSON into segment files, rotated once
+    they reach ``segment_bytes`` or are older than ``segment_seconds``.
+    The segment being written carries a ``.part`` suffix and is renamed
+    once sealed, so readers can safely stream every ``*.ndjson`` file.
+    """
+
+    def __init__(self, directory: str, segment_bytes: int, segment_seconds: float, queue_size: int):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._path: Optional[str] = None
+        self._written = 0
+        self._opened_at = 0.0
+        self._sequence = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        if not os.access(self.directory, os.W_OK):
+            raise PermissionError(f"Event log directory is not writable: {self.directory}")
+        self._recover_orphans()
+        self._thread = threading.Thread(target=self._run, name="dialog-event-log", daemon=True)
+        self._thread.start()
+
+    def record(self, event: Dict[str, Any]) -> None:
+        """Queue an event without blocking; drops it if the writer is behind"""
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(f"Dialog event log queue full - {self.dropped} events dropped")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending events and seal the current segment"""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _recover_orphans(self):
+        """Seal segments left open by processes that died without closing them"""
+        for path in glob.glob(os.path.join(self.directory, "*" + OPEN_SEGMENT_SUFFIX)):
+            try:
+                pid = int(os.path.basename(path).split("-")[2])
+            except (IndexError, ValueError):
+                continue
+            # Nothing is open yet, so a segment with our own pid is from a
+            # previous run (containers restart with the same pid)
+            if pid != os.getpid() and _pid_alive(pid):
+                continue
+            try:
+                os.replace(path, path[:-len(OPEN_SEGMENT_SUFFIX)] + SEGMENT_SUFFIX)
+                logger.info(f"Recovered orphaned dialog event segment {path}")
+            except OSError as e:
+                logger.error(f"Could not recover dialog event segment {path}: {str(e)}")
+
+    def _run(self):
+        """Writer loop: drain the queue in batches and append them to the segment"""
+        while True:
+            try:
+                event = self._queue.get(timeout=self._seal_timeout())
+            except queue.Empty:
+                self._seal()
+                continue
+
+            batch = [event]
+            while event is not None:
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(event)
+
+            try:
+                self._write(e for e in batch if e is not None)
+            except Exception as e:
+                logger.error(f"Dialog event log write error: {str(e)}")
+
+            if batch[-1] is None:
+                self._seal()
+                return
+            if self._file is not None and self._seal_timeout() == 0:
+                self._seal()
+
+    def _seal_timeout(self) -> Optional[float]:
+        """Seconds until the open segment is due to be sealed; None when idle"""
+        if self._file is None:
+            return None
+        return max(0.0, self._opened_at + self.segment_seconds - time.monotonic())
+
+    def _write(self, events):
+        for event in events:
+            line = json.dumps(event, separators=(",", ":")) + "\n"
+            if self._file is None:
+                self._open()
+            self._file.write(line)
+            self._written += len(line)
+            if self._written >= self.segment_bytes:
+                self._seal()
+        if self._file is not None:
+            self._file.flush()
+
+    def _open(self):
+        """Start a new segment named by creation time, pid and sequence number"""
+        self._sequence += 1
+        name = "dialog-{}-{}-{:06d}".format(
+            datetime.now().strftime("%Y%m%dT%H%M%S"), os.getpid(), self._sequence
+        )
+        self._path = os.path.join(self.directory, name + OPEN_SEGMENT_SUFFIX)
+        self._file = open(self._path, "a", encoding="utf-8")
+        self._written = 0
+        self._opened_at = time.monotonic()
+
+    def _seal(self):
+        """Close the current segment and publish it under its final name"""
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+            os.replace(self._path, self._path[:-len(OPEN_SEGMENT_SUFFIX)] + SEGMENT_SUFFIX)
+        except Exception as e:
+            logger.error(f"Dialog event log rotation error: {str(e)}")
+        finally:
+            self._file = None
+            self._path = None
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process (e.g. a sibling worker) still owns a segment"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but belongs to another user
+        return True
+    return True
+
+def mask_input(menu: Optional[str], user_input: str) -> str:
+    """Hide PINs typed at the auth prompt before the input is persisted"""
+    return "***" if menu == "auth_prompt" and user_input else user_input
+
+def build_event(
+    session_id: str,
+    menu: Optional[str],
+    user_input: str,
+    next_menu: Optional[str],
+    outcome: str,
+    started: float
+) -> Dict[str, Any]:
+    """Build a dialog event for one request/response hop"""
+    return {
+        "ts": time.time(),
+        "session_id": session_id,
+        "menu": menu,
+        "input": mask_input(menu, user_input),
+        "next_menu": next_menu,
+        "outcome": outcome,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 3)
+    }
@@ -2,6 +2,7 @@ from fastapi import FastAPI, Form, HTTPException, Depends, status
 from fastapi.responses import JSONResponse
 from fastapi.security import APIKeyHeader
 from app.ussd_engine import USSDSessionManager
+from app.event_log import DialogEventLog, mask_input
 from app.config import settings
 import uuid
 import logging
@@ -22,7 +23,20 @@ app = FastAPI(
     version="1.0.0"
 )
 
-ussd_manager = USSDSessionManager()
+event_log: Optional[DialogEventLog] = None
+if settings.EVENT_LOG_ENABLED:
+    try:
+        event_log = DialogEventLog(
+            directory=settings.EVENT_LOG_DIR,
+            segment_bytes=settings.EVENT_LOG_SEGMENT_BYTES,
+            segment_seconds=settings.EVENT_LOG_SEGMENT_SECONDS,
+            queue_size=settings.EVENT_LOG_QUEUE_SIZE
+        )
+    except OSError as e:
+        # Analytics must never stop the server from serving
+        logger.error(f"Dialog event log disabled - cannot write to {settings.EVENT_LOG_DIR}: {str(e)}")
+
+ussd_manager = USSDSessionManager(event_log=event_log)
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 async def verify_api_key(api_key: Optional[str] = Depends(api_key_header)):
@@ -40,6 +54,12 @@ async def verify_api_key(api_key: Optional[str] = Depends(api_key_header)):
         )
     return api_key
 
+@app.on_event("shutdown")
+async def close_event_log():
+    """Flush pending dialog events and seal the open log segment"""
+    if event_log:
+        event_log.close()
+
 @app.post("/ussd")
 async def handle_ussd(
     session_id: str = Form(default_factory=lambda: str(uuid.uuid4())),
@@ -59,10 +79,11 @@ async def handle_ussd(
         service_code: USSD service code
     """
     try:
+        menu = ussd_manager.sessions.get(session_id, {}).get("current_menu")
         logger.info(
             f"USSD request - Session: {session_id}, "
             f"Phone: {phone_number}, "
-            f"Input: '{user_input}'"
+            f"Input: '{mask_input(menu, user_input)}'"
         )
         
         if not phone_number:
@@ -3,15 +3,17 @@ from datetime import datetime, timedelta
 from app.config import settings
 from app.models import User, Session, Transaction
 from app.auth import AuthManager
+from app.event_log import DialogEventLog, build_event
 from typing import Dict, Optional, List
 import logging
 
 logger = logging.getLogger(__name__)
 
 class USSDSessionManager:
-    def __init__(self):
+    def __init__(self, event_log: Optional[DialogEventLog] = None):
         self.sessions: Dict[str, Dict] = {}
         self.menu_tree = self._build_menu_tree()
+        self.event_log = event_log
 
     def _build_menu_tree(self) -> Dict:
         """Build the USSD menu structure"""
@@ -75,22 +77,50 @@ class USSDSessionManager:
         Returns:
             USSD response string (CON or END)
         """
+        started = time.perf_counter()
+        menu = None
+        session = None
+        
         try:
             # Initialize or get existing session
             session = self._get_or_create_session(session_id, phone_number)
+            menu = session.get("current_menu")
             
             # Check for session timeout
             if self._is_session_expired(session):
                 self._end_session(session_id)
+                self._log_event(session_id, menu, user_input, None, "timeout", started)
                 return "END Session timed out. Please start again."
             
             # Process user input
-            return self._process_input(session, user_input)
+            response = self._process_input(session, user_input)
+            outcome = "end" if response.startswith("END") else "continue"
+            self._log_event(session_id, menu, user_input, session.get("current_menu"), outcome, started)
+            return response
             
         except Exception as e:
             logger.error(f"Error handling USSD request: {str(e)}", exc_info=True)
+            next_menu = session.get("current_menu") if session else None
+            self._log_event(session_id, menu, user_input, next_menu, "error", started)
             return "END System error occurred. Please try again later."
 
+    def _log_event(
+        self,
+        session_id: str,
+        menu: Optional[str],
+        user_input: str,
+        next_menu: Optional[str],
+        outcome: str,
+        started: float
+    ):
+        """Append a dialog hop to the event log, if one is configured"""
+        if not self.event_log:
+            return
+        try:
+            self.event_log.record(build_event(session_id, menu, user_input, next_menu, outcome, started))
+        except Exception as e:
+            logger.error(f"Error recording dialog event for {session_id}: {str(e)}")
+
     def _get_or_create_session(self, session_id: str, phone_number: str) -> Dict:
         """Get existing session or create new one"""
         if session_id in self.sessions:
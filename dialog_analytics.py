@@ -0,0 +1,149 @@
+"""
+Offline analytics over the dialog event log.
+
+Streams the NDJSON segments written by app.event_log and reports menu
+funnels, drop-off per menu node and latency percentiles without touching
+the production database.
+
+    python dialog_analytics.py funnel main account account_balance
+    python dialog_analytics.py dropoff
+    python dialog_analytics.py latency --by-menu
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+from collections import defaultdict
+from typing import Dict, Iterator, List
+
+def iter_segments(directory: str, include_open: bool = False) -> List[str]:
+    """List segment files in write order (names start with their creation time)"""
+    paths = glob.glob(os.path.join(directory, "*.ndjson"))
+    if include_open:
+        paths += glob.glob(os.path.join(directory, "*.ndjson.part"))
+    return sorted(paths, key=os.path.basename)
+
+def iter_events(directory: str, include_open: bool = False) -> Iterator[Dict]:
+    """Stream events from every segment, skipping truncated or corrupt lines"""
+    for path in iter_segments(directory, include_open):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def funnel(events: Iterator[Dict], steps: List[str]) -> List[int]:
+    """Count sessions reaching each funnel step, in order"""
+    progress: Dict[str, int] = {}
+    for event in events:
+        session_id = event.get("session_id")
+        reached = progress.get(session_id, 0)
+        for node in (event.get("menu"), event.get("next_menu")):
+            if reached < len(steps) and node == steps[reached]:
+                reached += 1
+        progress[session_id] = reached
+
+    counts = [0] * len(steps)
+    for reached in progress.values():
+        for i in range(reached):
+            counts[i] += 1
+    return counts
+
+def dropoff(events: Iterator[Dict]) -> Dict[str, Dict[str, int]]:
+    """
+    Per menu node: sessions that visited it, sessions that left the dialog
+    there, and how many of those were abandoned (waiting for input or timed out)
+    """
+    visited: Dict[str, set] = defaultdict(set)
+    last: Dict[str, Dict] = {}
+    for event in events:
+        session_id = event.get("session_id")
+        for node in (event.get("menu"), event.get("next_menu")):
+            if node:
+                visited[session_id].add(node)
+        last[session_id] = event
+
+    stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"visits": 0, "exits": 0, "abandoned": 0})
+    for session_id, nodes in visited.items():
+        for node in nodes:
+            stats[node]["visits"] += 1
+        event = last[session_id]
+        node = event.get("next_menu") or event.get("menu")
+        if node:
+            stats[node]["exits"] += 1
+            if event.get("outcome") in ("continue", "timeout"):
+                stats[node]["abandoned"] += 1
+    return stats
+
+def latency(events: Iterator[Dict], by_menu: bool = False) -> Dict[str, List[float]]:
+    """Collect sorted latencies, overall or keyed by the menu the input arrived at"""
+    samples: Dict[str, List[float]] = defaultdict(list)
+    for event in events:
+        if event.get("latency_ms") is None:
+            continue
+        key = (event.get("menu") or "-") if by_menu else "all"
+        samples[key].append(event["latency_ms"])
+    for values in samples.values():
+        values.sort()
+    return samples
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Analyze the USSD dialog event log")
+    parser.add_argument("--dir", default=os.getenv("EVENT_LOG_DIR", "logs/events"),
+                        help="Event log directory (default: $EVENT_LOG_DIR or logs/events)")
+    parser.add_argument("--include-open", action="store_true",
+                        help="Also read segments that are still being written")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    funnel_parser = commands.add_parser("funnel", help="Sessions reaching each menu in order")
+    funnel_parser.add_argument("steps", nargs="+", help="Menu identifiers, e.g. main account")
+    commands.add_parser("dropoff", help="Drop-off per menu node")
+    latency_parser = commands.add_parser("latency", help="Request latency percentiles")
+    latency_parser.add_argument("--by-menu", action="store_true", help="Break down by menu")
+
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.dir):
+        print(f"Event log directory not found: {args.dir}", file=sys.stderr)
+        return 1
+
+    events = iter_events(args.dir, args.include_open)
+
+    if args.command == "funnel":
+        counts = funnel(events, args.steps)
+        top = counts[0] if counts else 0
+        print(f"{'step':<24}{'sessions':>10}{'of start':>10}")
+        for step, count in zip(args.steps, counts):
+            share = f"{count / top:.1%}" if top else "-"
+            print(f"{step:<24}{count:>10}{share:>10}")
+
+    elif args.command == "dropoff":
+        stats = dropoff(events)
+        print(f"{'menu':<24}{'visits':>10}{'exits':>10}{'abandoned':>11}{'rate':>8}")
+        for node, s in sorted(stats.items(), key=lambda item: -item[1]["abandoned"]):
+            rate = f"{s['abandoned'] / s['visits']:.1%}" if s["visits"] else "-"
+            print(f"{node:<24}{s['visits']:>10}{s['exits']:>10}{s['abandoned']:>11}{rate:>8}")
+
+    elif args.command == "latency":
+        samples = latency(events, args.by_menu)
+        print(f"{'menu':<24}{'count':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for key, values in sorted(samples.items()):
+            print(
+                f"{key:<24}{len(values):>10}"
+                f"{percentile(values, 50):>10.2f}{percentile(values, 90):>10.2f}"
+                f"{percentile(values, 99):>10.2f}{values[-1]:>10.2f}"
+            )
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
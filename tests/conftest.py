@@ -0,0 +1,19 @@
+import os
+import sys
+import types
+from unittest.mock import MagicMock
+
+# Settings are validated on import; the tests never talk to Supabase
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE", "test-service-role")
+os.environ.setdefault("SUPABASE_JWT_SECRET", "test-jwt-secret")
+os.environ.setdefault("EVENT_LOG_ENABLED", "False")
+
+# The real client connects on import
+supabase_client = types.ModuleType("app.supabase_client")
+supabase_client.supabase = MagicMock()
+sys.modules.setdefault("app.supabase_client", supabase_client)
+
+# dialog_analytics.py lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
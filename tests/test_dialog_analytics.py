@@ -0,0 +1,76 @@
+import json
+
+import dialog_analytics
+
+def _event(session_id, menu, next_menu, outcome="continue", latency_ms=1.0):
+    return {
+        "session_id": session_id,
+        "menu": menu,
+        "next_menu": next_menu,
+        "outcome": outcome,
+        "latency_ms": latency_ms
+    }
+
+EVENTS = [
+    # s1 reaches the balance screen
+    _event("s1", "main", "main"),
+    _event("s1", "main", "auth_prompt"),
+    _event("s1", "auth_prompt", "account"),
+    _event("s1", "account", "account_balance"),
+    # s2 abandons at the PIN prompt
+    _event("s2", "main", "main"),
+    _event("s2", "main", "auth_prompt"),
+    # s3 picks an invalid option
+    _event("s3", "main", "main"),
+    _event("s3", "main", "main", outcome="end"),
+]
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+
+    assert dialog_analytics.percentile(values, 50) == 50.0
+    assert dialog_analytics.percentile(values, 99) == 99.0
+    assert dialog_analytics.percentile(values, 100) == 100.0
+    assert dialog_analytics.percentile([7.0], 90) == 7.0
+    assert dialog_analytics.percentile([], 50) == 0.0
+
+def test_funnel_counts_sessions_reaching_steps_in_order():
+    counts = dialog_analytics.funnel(iter(EVENTS), ["main", "auth_prompt", "account", "account_balance"])
+
+    assert counts == [3, 2, 1, 1]
+
+def test_funnel_ignores_out_of_order_steps():
+    events = [_event("s1", "account", "account"), _event("s1", "main", "main")]
+
+    assert dialog_analytics.funnel(iter(events), ["main", "account"]) == [1, 0]
+
+def test_dropoff_per_menu_node():
+    stats = dialog_analytics.dropoff(iter(EVENTS))
+
+    assert stats["main"] == {"visits": 3, "exits": 1, "abandoned": 0}
+    assert stats["auth_prompt"] == {"visits": 2, "exits": 1, "abandoned": 1}
+    assert stats["account_balance"] == {"visits": 1, "exits": 1, "abandoned": 1}
+
+def test_latency_by_menu_is_sorted():
+    events = [
+        _event("s1", "main", "main", latency_ms=3.0),
+        _event("s1", "main", "account", latency_ms=1.0),
+        _event("s1", "account", "account", latency_ms=2.0),
+    ]
+
+    assert dialog_analytics.latency(iter(events)) == {"all": [1.0, 2.0, 3.0]}
+    assert dialog_analytics.latency(iter(events), by_menu=True) == {"main": [1.0, 3.0], "account": [2.0]}
+
+def test_iter_events_reads_sealed_segments_and_skips_corrupt_lines(tmp_path):
+    (tmp_path / "dialog-20260101T000000-1-000001.ndjson").write_text(
+        json.dumps({"session_id": "s1"}) + "\n" + '{"sess'
+    )
+    (tmp_path / "dialog-20260101T000001-1-000002.ndjson.part").write_text(
+        json.dumps({"session_id": "s2"}) + "\n"
+    )
+
+    sealed = list(dialog_analytics.iter_events(str(tmp_path)))
+    everything = list(dialog_analytics.iter_events(str(tmp_path), include_open=True))
+
+    assert sealed == [{"session_id": "s1"}]
+    assert everything == [{"session_id": "s1"}, {"session_id": "s2"}]
@@ -0,0 +1,85 @@
+import json
+import os
+import time
+
+from app.event_log import DialogEventLog, build_event, mask_input
+
+# Above the kernel's pid_max, so never a live process
+DEAD_PID = 4194305
+
+def _make_log(directory, segment_bytes=10 ** 6, segment_seconds=60):
+    return DialogEventLog(
+        directory=str(directory),
+        segment_bytes=segment_bytes,
+        segment_seconds=segment_seconds,
+        queue_size=100
+    )
+
+def _read_events(directory):
+    events = []
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name)) as f:
+            events += [json.loads(line) for line in f]
+    return events
+
+def test_close_seals_open_segment(tmp_path):
+    log = _make_log(tmp_path)
+    log.record({"session_id": "s1"})
+    log.close()
+
+    names = os.listdir(tmp_path)
+    assert len(names) == 1
+    assert names[0].endswith(".ndjson")
+    assert _read_events(tmp_path) == [{"session_id": "s1"}]
+
+def test_segments_rotate_by_size(tmp_path):
+    log = _make_log(tmp_path, segment_bytes=50)
+    for i in range(10):
+        log.record({"session_id": f"s{i}", "padding": "x" * 20})
+    log.close()
+
+    names = os.listdir(tmp_path)
+    assert len(names) > 1
+    assert all(name.endswith(".ndjson") for name in names)
+    assert [e["session_id"] for e in _read_events(tmp_path)] == [f"s{i}" for i in range(10)]
+
+def test_idle_segment_sealed_after_max_age(tmp_path):
+    log = _make_log(tmp_path, segment_seconds=0.1)
+    log.record({"session_id": "s1"})
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        names = os.listdir(tmp_path)
+        if names and names[0].endswith(".ndjson"):
+            break
+        time.sleep(0.02)
+    assert [n for n in os.listdir(tmp_path) if n.endswith(".ndjson")]
+    log.close()
+
+def test_orphaned_segments_recovered_on_startup(tmp_path):
+    dead = tmp_path / f"dialog-20260101T000000-{DEAD_PID}-000001.ndjson.part"
+    own = tmp_path / f"dialog-20260101T000000-{os.getpid()}-000001.ndjson.part"
+    sibling = tmp_path / f"dialog-20260101T000000-{os.getppid()}-000001.ndjson.part"
+    for path in (dead, own, sibling):
+        path.write_text('{"session_id": "s1"}\n{"sess')
+
+    _make_log(tmp_path).close()
+
+    names = set(os.listdir(tmp_path))
+    assert dead.name[:-len(".part")] in names
+    assert own.name[:-len(".part")] in names
+    assert sibling.name in names
+
+def test_mask_input_hides_pin_at_auth_prompt():
+    assert mask_input("auth_prompt", "1234") == "***"
+    assert mask_input("auth_prompt", "") == ""
+    assert mask_input("main", "1") == "1"
+
+def test_build_event_masks_pin():
+    event = build_event("s1", "auth_prompt", "1234", "account", "continue", time.perf_counter())
+
+    assert event["input"] == "***"
+    assert event["menu"] == "auth_prompt"
+    assert event["next_menu"] == "account"
+    assert event["outcome"] == "continue"
+    assert event["latency_ms"] >= 0
@@ -0,0 +1,84 @@
+import pytest
+
+import app.ussd_engine as ussd_engine
+from app.ussd_engine import USSDSessionManager
+
+class RecordingEventLog:
+    def __init__(self):
+        self.events = []
+
+    def record(self, event):
+        self.events.append(event)
+
+@pytest.fixture
+def event_log():
+    return RecordingEventLog()
+
+@pytest.fixture
+def manager(monkeypatch, event_log):
+    monkeypatch.setattr(ussd_engine.Session, "create", staticmethod(lambda data: data))
+    monkeypatch.setattr(ussd_engine.Session, "update", staticmethod(lambda session_id, updates: True))
+    monkeypatch.setattr(
+        ussd_engine.AuthManager,
+        "authenticate",
+        staticmethod(lambda phone, pin: (pin == "1234", "Invalid PIN. 2 attempts remaining."))
+    )
+    return USSDSessionManager(event_log=event_log)
+
+def test_initial_request_logs_continue(manager, event_log):
+    response = manager.handle_request(session_id="s1", phone_number="+250780000000")
+
+    assert response.startswith("CON Welcome")
+    event = event_log.events[-1]
+    assert event["session_id"] == "s1"
+    assert event["menu"] == "main"
+    assert event["next_menu"] == "main"
+    assert event["outcome"] == "continue"
+
+def test_next_menu_taken_after_processing(manager, event_log):
+    manager.handle_request(session_id="s1", phone_number="+250780000000")
+    response = manager.handle_request(session_id="s1", phone_number="+250780000000", user_input="1")
+
+    assert response == "CON Please enter your PIN:"
+    event = event_log.events[-1]
+    assert event["menu"] == "main"
+    assert event["input"] == "1"
+    assert event["next_menu"] == "auth_prompt"
+
+def test_pin_hop_is_masked(manager, event_log):
+    manager.handle_request(session_id="s1", phone_number="+250780000000")
+    manager.handle_request(session_id="s1", phone_number="+250780000000", user_input="1")
+    response = manager.handle_request(session_id="s1", phone_number="+250780000000", user_input="1234")
+
+    assert response.startswith("CON Account Services")
+    event = event_log.events[-1]
+    assert event["menu"] == "auth_prompt"
+    assert event["input"] == "***"
+    assert event["next_menu"] == "account"
+    assert event["outcome"] == "continue"
+
+def test_end_response_logs_end(manager, event_log):
+    manager.handle_request(session_id="s1", phone_number="+250780000000")
+    response = manager.handle_request(session_id="s1", phone_number="+250780000000", user_input="9")
+
+    assert response.startswith("END")
+    assert event_log.events[-1]["outcome"] == "end"
+
+def test_error_logs_error(manager, event_log, monkeypatch):
+    def fail(session, user_input):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(manager, "_process_input", fail)
+
+    response = manager.handle_request(session_id="s1", phone_number="+250780000000")
+
+    assert response == "END System error occurred. Please try again later."
+    event = event_log.events[-1]
+    assert event["outcome"] == "error"
+    assert event["menu"] == "main"
+
+def test_works_without_event_log(monkeypatch):
+    monkeypatch.setattr(ussd_engine.Session, "create", staticmethod(lambda data: data))
+
+    response = USSDSessionManager().handle_request(session_id="s1", phone_number="+250780000000")
+
+    assert response.startswith("CON Welcome")